@@ -15,14 +15,16 @@ This module implements the `GapScannerImpl`, responsible for identifying
 knowledge gaps (Negative Space Analysis) in the Knowledge Graph.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from coreason_identity.models import UserContext
 
 from coreason_episteme.config import settings
-from coreason_episteme.interfaces import CodexClient, GraphNexusClient, SearchClient
+from coreason_episteme.interfaces import BatchCodexClient, CodexClient, GraphNexusClient, SearchClient
 from coreason_episteme.models import KnowledgeGap, KnowledgeGapType
+from coreason_episteme.utils.concurrency import map_bounded
 from coreason_episteme.utils.logger import logger
 
 
@@ -40,12 +42,30 @@ class GapScannerImpl:
         codex_client: Client for Codex.
         search_client: Client for Search.
         similarity_threshold: Threshold for semantic similarity to consider a disconnect significant.
+        similarity_cache_size: Maximum number of cluster-pair similarity scores kept between scans.
+        codex_max_concurrency: Maximum number of per-pair Codex requests in flight when the
+            client has no batch endpoint.
     """
 
     graph_client: GraphNexusClient
     codex_client: CodexClient
     search_client: SearchClient
     similarity_threshold: float = field(default_factory=lambda: settings.GAP_SCANNER_SIMILARITY_THRESHOLD)
+    similarity_cache_size: int = field(default_factory=lambda: settings.GAP_SCANNER_SIMILARITY_CACHE_SIZE)
+    codex_max_concurrency: int = field(default_factory=lambda: settings.CODEX_MAX_CONCURRENCY)
+    _similarity_cache: OrderedDict[Tuple[str, str], float] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.similarity_cache_size < 0:
+            raise ValueError(f"similarity_cache_size must be non-negative, got {self.similarity_cache_size}")
+        if self.codex_max_concurrency < 1:
+            raise ValueError(f"codex_max_concurrency must be at least 1, got {self.codex_max_concurrency}")
+
+    def clear_similarity_cache(self) -> None:
+        """Discards all remembered cluster-pair similarity scores."""
+        self._similarity_cache.clear()
 
     async def scan(self, target: str, context: UserContext) -> List[KnowledgeGap]:
         """
@@ -53,7 +73,8 @@ class GapScannerImpl:
 
         Steps:
         1. Cluster Analysis: Finds disconnected subgraphs in GraphNexus.
-           Checks semantic similarity via Codex.
+           Checks semantic similarity of candidate pairs via Codex, reusing scores
+           remembered from earlier scans.
         2. Literature Discrepancy: Queries SearchClient for inconsistencies.
 
         Args:
@@ -74,29 +95,7 @@ class GapScannerImpl:
         raw_clusters = await self.graph_client.find_disconnected_clusters({"target": target})
         logger.debug(f"Found {len(raw_clusters)} potential disconnected cluster pairs.")
 
-        for pair in raw_clusters:
-            cluster_a_id = pair.get("cluster_a_id")
-            cluster_b_id = pair.get("cluster_b_id")
-            cluster_a_name = pair.get("cluster_a_name", "Unknown")
-            cluster_b_name = pair.get("cluster_b_name", "Unknown")
-
-            if cluster_a_id and cluster_b_id:
-                similarity = await self.codex_client.get_semantic_similarity(cluster_a_id, cluster_b_id)
-                if similarity >= self.similarity_threshold:
-                    logger.info(
-                        f"Found disconnect with high similarity ({similarity}): {cluster_a_name} <-> {cluster_b_name}"
-                    )
-                    description = (
-                        f"Cluster Disconnect: {cluster_a_name} and {cluster_b_name} "
-                        f"are similar ({similarity}) but unconnected."
-                    )
-                    gaps.append(
-                        KnowledgeGap(
-                            description=description,
-                            type=KnowledgeGapType.CLUSTER_DISCONNECT,
-                            source_nodes=[cluster_a_id, cluster_b_id],
-                        )
-                    )
+        gaps.extend(await self._find_cluster_gaps(raw_clusters))
 
         # 2. Literature Discrepancy
         logger.debug(f"Searching for literature inconsistencies for {target}...")
@@ -107,3 +106,110 @@ class GapScannerImpl:
 
         logger.info(f"Total gaps found for {target}: {len(gaps)}")
         return gaps
+
+    async def _find_cluster_gaps(self, raw_clusters: List[Dict[str, Any]]) -> List[KnowledgeGap]:
+        """
+        Scores candidate cluster pairs and reports the similar-but-unconnected ones.
+
+        Pairs missing either cluster ID are dropped up front; the remaining candidates
+        are scored via `_get_similarities`.
+
+        Args:
+            raw_clusters: Cluster pairs as returned by GraphNexus.
+
+        Returns:
+            List[KnowledgeGap]: A CLUSTER_DISCONNECT gap for each pair at or above the similarity threshold.
+        """
+        candidates = [pair for pair in raw_clusters if pair.get("cluster_a_id") and pair.get("cluster_b_id")]
+        if not candidates:
+            return []
+
+        similarities = await self._get_similarities(
+            [(pair["cluster_a_id"], pair["cluster_b_id"]) for pair in candidates]
+        )
+
+        gaps: List[KnowledgeGap] = []
+        for pair, similarity in zip(candidates, similarities, strict=True):
+            cluster_a_id = pair["cluster_a_id"]
+            cluster_b_id = pair["cluster_b_id"]
+            cluster_a_name = pair.get("cluster_a_name", "Unknown")
+            cluster_b_name = pair.get("cluster_b_name", "Unknown")
+
+            if similarity >= self.similarity_threshold:
+                logger.info(
+                    f"Found disconnect with high similarity ({similarity}): {cluster_a_name} <-> {cluster_b_name}"
+                )
+                description = (
+                    f"Cluster Disconnect: {cluster_a_name} and {cluster_b_name} "
+                    f"are similar ({similarity}) but unconnected."
+                )
+                gaps.append(
+                    KnowledgeGap(
+                        description=description,
+                        type=KnowledgeGapType.CLUSTER_DISCONNECT,
+                        source_nodes=[cluster_a_id, cluster_b_id],
+                    )
+                )
+        return gaps
+
+    async def _get_similarities(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """
+        Returns the semantic similarity of each pair, consulting Codex only for unseen pairs.
+
+        Similarity is symmetric, so (A, B) and (B, A) share one cache entry. All cache misses
+        are resolved together via `_score_pairs`, and the least recently used scores are
+        evicted once `similarity_cache_size` is exceeded.
+
+        Args:
+            pairs: The (cluster_a_id, cluster_b_id) pairs to score.
+
+        Returns:
+            List[float]: The similarity scores, in the same order as `pairs`.
+        """
+        keys = [(a, b) if a <= b else (b, a) for a, b in pairs]
+
+        scores: Dict[Tuple[str, str], float] = {}
+        for key in keys:
+            if key in self._similarity_cache:
+                self._similarity_cache.move_to_end(key)
+                scores[key] = self._similarity_cache[key]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in scores]
+        if missing:
+            fetched = await self._score_pairs(missing)
+            for key, score in zip(missing, fetched, strict=True):
+                scores[key] = score
+                self._similarity_cache[key] = score
+            while len(self._similarity_cache) > self.similarity_cache_size:
+                self._similarity_cache.popitem(last=False)
+
+        return [scores[key] for key in keys]
+
+    async def _score_pairs(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """
+        Scores pairs with Codex, in one round-trip when the client supports batching.
+
+        Clients implementing `BatchCodexClient` get a single batch call; otherwise the per-pair
+        requests are issued concurrently, at most `codex_max_concurrency` at a time.
+
+        Args:
+            pairs: The (entity1, entity2) pairs to score.
+
+        Returns:
+            List[float]: The similarity scores, in the same order as `pairs`.
+
+        Raises:
+            ValueError: If Codex does not return exactly one score per pair.
+        """
+        if isinstance(self.codex_client, BatchCodexClient):
+            scores = await self.codex_client.get_semantic_similarity_batch(pairs)
+        else:
+            scores = await map_bounded(
+                lambda pair: self.codex_client.get_semantic_similarity(*pair),
+                pairs,
+                self.codex_max_concurrency,
+            )
+
+        if len(scores) != len(pairs):
+            raise ValueError(f"Codex returned {len(scores)} similarity scores for {len(pairs)} pairs")
+        return scores
@@ -8,6 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -28,8 +29,14 @@ class Settings(BaseSettings):
 
     # Engine
     MAX_RETRIES: int = 3
+    MAX_PARALLEL_GAPS: int = Field(default=8, ge=1)
     GAP_SCANNER_SIMILARITY_THRESHOLD: float = 0.75
+    GAP_SCANNER_SIMILARITY_CACHE_SIZE: int = Field(default=10_000, ge=0)
     DRUGGABILITY_THRESHOLD: float = 0.5
 
+    # Clients
+    # Must be at least 1: a zero-sized semaphore would never admit a request.
+    CODEX_MAX_CONCURRENCY: int = Field(default=32, ge=1)
+
 
 settings = Settings()
@@ -30,7 +30,8 @@ from coreason_episteme.interfaces import (
     ProtocolDesigner,
     VeritasClient,
 )
-from coreason_episteme.models import CritiqueSeverity, Hypothesis, HypothesisTrace
+from coreason_episteme.models import CritiqueSeverity, Hypothesis, HypothesisTrace, KnowledgeGap
+from coreason_episteme.utils.concurrency import map_bounded
 from coreason_episteme.utils.logger import logger
 
 
@@ -51,6 +52,7 @@ class EpistemeEngineAsync:
         protocol_designer: Component to design validation experiments (Protocol Design).
         veritas_client: Client for logging provenance traces.
         max_retries: Maximum number of refinement attempts for a single gap.
+        max_parallel_gaps: Maximum number of gaps refined concurrently.
     """
 
     gap_scanner: GapScanner
@@ -60,6 +62,11 @@ class EpistemeEngineAsync:
     protocol_designer: ProtocolDesigner
     veritas_client: VeritasClient
     max_retries: int = field(default_factory=lambda: settings.MAX_RETRIES)
+    max_parallel_gaps: int = field(default_factory=lambda: settings.MAX_PARALLEL_GAPS)
+
+    def __post_init__(self) -> None:
+        if self.max_parallel_gaps < 1:
+            raise ValueError(f"max_parallel_gaps must be at least 1, got {self.max_parallel_gaps}")
 
     async def __aenter__(self) -> "EpistemeEngineAsync":
         # Placeholder for resource initialization if needed
@@ -80,7 +87,7 @@ class EpistemeEngineAsync:
 
         Pipeline Steps:
         1. **Gap Scanning:** Identify disconnected clusters or literature inconsistencies.
-        2. **Refinement Loop:** For each gap:
+        2. **Refinement Loop:** For each gap (up to max_parallel_gaps concurrently):
             a. **Latent Bridging:** Propose a target/mechanism to bridge the gap.
             b. **Causal Simulation:** Validate the mechanism via counterfactuals.
             c. **Adversarial Review:** Critique the hypothesis (Toxicology, IP, etc.).
@@ -103,7 +110,6 @@ class EpistemeEngineAsync:
             user_id=context.user_id,
             protocol_title=disease_id,
         )
-        results: List[Hypothesis] = []
 
         # 1. Gap Scanning
         gaps = await self.gap_scanner.scan(disease_id, context=context)
@@ -111,114 +117,128 @@ class EpistemeEngineAsync:
             logger.info("No knowledge gaps found. Exiting.")
             return []
 
-        for gap in gaps:
-            excluded_targets: List[str] = []
-            attempts = 0
+        # Gaps are independent, so refine them concurrently; results keep the gap order.
+        # A failure that escapes a gap cancels the gaps still in flight.
+        outcomes = await map_bounded(lambda gap: self._process_gap(gap, context), gaps, self.max_parallel_gaps)
+        results = [hypothesis for hypothesis in outcomes if hypothesis is not None]
 
-            # Initialize Trace
-            trace = HypothesisTrace(gap=gap, gap_id=gap.id, status="PENDING")
+        logger.info(f"Engine finished. Generated {len(results)} hypotheses.")
+        return results
 
-            try:
-                while attempts < self.max_retries:
-                    attempts += 1
-                    trace.excluded_targets_history = list(excluded_targets)  # Update history
-                    trace.refinement_retries = attempts - 1
+    async def _process_gap(self, gap: KnowledgeGap, context: UserContext) -> Optional[Hypothesis]:
+        """
+        Runs the refinement loop for a single gap and logs its provenance trace.
 
-                    logger.info(
-                        f"Attempt {attempts}/{self.max_retries} for gap: {gap.description[:50]}... "
-                        f"(Excluded: {len(excluded_targets)})"
-                    )
+        Args:
+            gap: The knowledge gap to bridge.
+            context: The user context triggering the process.
 
-                    # 2. Latent Bridging
-                    bridge_result = await self.bridge_builder.generate_hypothesis(
-                        gap, context=context, excluded_targets=excluded_targets
-                    )
+        Returns:
+            Optional[Hypothesis]: The accepted hypothesis, or None if the gap was discarded or failed.
+        """
+        excluded_targets: List[str] = []
+        attempts = 0
 
-                    # Accumulate bridge metadata
-                    trace.bridges_found_count = bridge_result.bridges_found_count
-                    trace.considered_candidates = bridge_result.considered_candidates
-
-                    hypothesis = bridge_result.hypothesis
-                    if not hypothesis:
-                        logger.info("No hypothesis generated for gap.")
-                        trace.status = "DISCARDED (No Bridge)"
-                        break
-
-                    # Link trace ID to hypothesis ID if available
-                    trace.hypothesis_id = hypothesis.id
-                    # Use the ensembl_id of the target as the bridge_id
-                    trace.bridge_id = hypothesis.target_candidate.ensembl_id
-
-                    # 3. Causal Simulation
-                    hypothesis = await self.causal_validator.validate(hypothesis, context=context)
-
-                    # Accumulate validation data
-                    trace.causal_validation_score = hypothesis.causal_validation_score
-                    trace.key_counterfactual = hypothesis.key_counterfactual
-
-                    # Filtering Policy: Discard if causal plausibility is too low.
-                    if hypothesis.causal_validation_score < 0.5:
-                        logger.info(
-                            f"Hypothesis {hypothesis.id} discarded due to low causal score "
-                            f"({hypothesis.causal_validation_score})."
-                        )
-                        trace.status = "DISCARDED (Low Causal Score)"
-                        break
-
-                    # 4. Adversarial Review
-                    hypothesis = await self.adversarial_reviewer.review(hypothesis, context=context)
-
-                    # Accumulate critiques
-                    trace.critiques = hypothesis.critiques
-
-                    # 5. Refinement Check
-                    fatal_critiques = [c for c in hypothesis.critiques if c.severity == CritiqueSeverity.FATAL]
-                    if fatal_critiques:
-                        target_symbol = hypothesis.target_candidate.symbol
-                        logger.warning(
-                            f"Hypothesis {hypothesis.id} rejected due to FATAL critiques ({len(fatal_critiques)}). "
-                            f"Refining loop -> Excluding {target_symbol}"
-                        )
-                        excluded_targets.append(target_symbol)
-                        continue
-                    else:
-                        # Success!
-                        # 6. Protocol Design
-                        hypothesis = await self.protocol_designer.design_experiment(hypothesis)
-
-                        trace.result = hypothesis
-                        trace.status = "ACCEPTED"
-
-                        # Log the final trace
-                        if trace.hypothesis_id:
-                            await self.veritas_client.log_trace(
-                                trace.hypothesis_id,
-                                trace.model_dump(),
-                            )
-
-                        results.append(hypothesis)
-                        break  # Move to next gap
-
-                # If loop exhausted without success or broke early
-                if trace.status != "ACCEPTED":
-                    # Log trace for failed attempt if we have an ID
-                    # If we never got a hypothesis ID (e.g. no bridges), we generate a UUID or use None
-                    # The interface requires hypothesis_id: str.
-                    log_id = trace.hypothesis_id or f"failed-gap-{gap.id}"
-                    await self.veritas_client.log_trace(
-                        log_id,
-                        trace.model_dump(),
-                    )
+        # Initialize Trace
+        trace = HypothesisTrace(gap=gap, gap_id=gap.id, status="PENDING")
+
+        try:
+            while attempts < self.max_retries:
+                attempts += 1
+                trace.excluded_targets_history = list(excluded_targets)  # Update history
+                trace.refinement_retries = attempts - 1
 
-            except Exception as e:
-                logger.exception(f"Error processing gap {gap.description}: {e}")
-                trace.status = f"ERROR: {str(e)}"
-                log_id = trace.hypothesis_id or f"error-gap-{gap.id}"
-                await self.veritas_client.log_trace(
-                    log_id,
-                    trace.model_dump(),
+                logger.info(
+                    f"Attempt {attempts}/{self.max_retries} for gap: {gap.description[:50]}... "
+                    f"(Excluded: {len(excluded_targets)})"
                 )
-                continue
 
-        logger.info(f"Engine finished. Generated {len(results)} hypotheses.")
-        return results
+                # 2. Latent Bridging
+                bridge_result = await self.bridge_builder.generate_hypothesis(
+                    gap, context=context, excluded_targets=excluded_targets
+                )
+
+                # Accumulate bridge metadata
+                trace.bridges_found_count = bridge_result.bridges_found_count
+                trace.considered_candidates = bridge_result.considered_candidates
+
+                hypothesis = bridge_result.hypothesis
+                if not hypothesis:
+                    logger.info("No hypothesis generated for gap.")
+                    trace.status = "DISCARDED (No Bridge)"
+                    break
+
+                # Link trace ID to hypothesis ID if available
+                trace.hypothesis_id = hypothesis.id
+                # Use the ensembl_id of the target as the bridge_id
+                trace.bridge_id = hypothesis.target_candidate.ensembl_id
+
+                # 3. Causal Simulation
+                hypothesis = await self.causal_validator.validate(hypothesis, context=context)
+
+                # Accumulate validation data
+                trace.causal_validation_score = hypothesis.causal_validation_score
+                trace.key_counterfactual = hypothesis.key_counterfactual
+
+                # Filtering Policy: Discard if causal plausibility is too low.
+                if hypothesis.causal_validation_score < 0.5:
+                    logger.info(
+                        f"Hypothesis {hypothesis.id} discarded due to low causal score "
+                        f"({hypothesis.causal_validation_score})."
+                    )
+                    trace.status = "DISCARDED (Low Causal Score)"
+                    break
+
+                # 4. Adversarial Review
+                hypothesis = await self.adversarial_reviewer.review(hypothesis, context=context)
+
+                # Accumulate critiques
+                trace.critiques = hypothesis.critiques
+
+                # 5. Refinement Check
+                fatal_critiques = [c for c in hypothesis.critiques if c.severity == CritiqueSeverity.FATAL]
+                if fatal_critiques:
+                    target_symbol = hypothesis.target_candidate.symbol
+                    logger.warning(
+                        f"Hypothesis {hypothesis.id} rejected due to FATAL critiques ({len(fatal_critiques)}). "
+                        f"Refining loop -> Excluding {target_symbol}"
+                    )
+                    excluded_targets.append(target_symbol)
+                    continue
+                else:
+                    # Success!
+                    # 6. Protocol Design
+                    hypothesis = await self.protocol_designer.design_experiment(hypothesis)
+
+                    trace.result = hypothesis
+                    trace.status = "ACCEPTED"
+
+                    # Log the final trace
+                    if trace.hypothesis_id:
+                        await self.veritas_client.log_trace(
+                            trace.hypothesis_id,
+                            trace.model_dump(),
+                        )
+
+                    return hypothesis
+
+            # Loop exhausted without success or broke early.
+            # Log trace for failed attempt if we have an ID
+            # If we never got a hypothesis ID (e.g. no bridges), we generate a UUID or use None
+            # The interface requires hypothesis_id: str.
+            log_id = trace.hypothesis_id or f"failed-gap-{gap.id}"
+            await self.veritas_client.log_trace(
+                log_id,
+                trace.model_dump(),
+            )
+
+        except Exception as e:
+            logger.exception(f"Error processing gap {gap.description}: {e}")
+            trace.status = f"ERROR: {str(e)}"
+            log_id = trace.hypothesis_id or f"error-gap-{gap.id}"
+            await self.veritas_client.log_trace(
+                log_id,
+                trace.model_dump(),
+            )
+
+        return None
@@ -15,7 +15,7 @@ This module uses Protocol to define the contracts that external dependencies
 and internal components must adhere to.
 """
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 from coreason_identity.models import UserContext
 
@@ -110,6 +110,7 @@ class CodexClient(Protocol):
     Interface for coreason-codex (The Dictionary).
 
     Provides ontology services, semantic similarity calculations, and target validation.
+    Clients that can score many pairs per round-trip also implement `BatchCodexClient`.
     """
 
     async def get_semantic_similarity(self, entity1: str, entity2: str) -> float:
@@ -138,6 +139,28 @@ class CodexClient(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchCodexClient(CodexClient, Protocol):
+    """
+    Optional extension of CodexClient for services with a batch similarity endpoint.
+
+    Consumers check for it at runtime and fall back to per-pair
+    `get_semantic_similarity` calls for plain CodexClient implementations.
+    """
+
+    async def get_semantic_similarity_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """
+        Calculates semantic similarity for many entity pairs in a single call.
+
+        Args:
+            pairs: The (entity1, entity2) pairs to score.
+
+        Returns:
+            List[float]: One similarity score per pair, in the same order as `pairs`.
+        """
+        ...
+
+
 class PrismClient(Protocol):
     """
     Interface for coreason-prism.
@@ -64,6 +64,7 @@ class EpistemeAsync:
     Async-Native Episteme Service.
 
     The core service responsible for generating scientific hypotheses asynchronously.
+    When no `client` is injected, the service creates its own on entry and closes it on exit.
     """
 
     def __init__(
@@ -77,7 +78,7 @@ class EpistemeAsync:
         client: Optional[httpx.AsyncClient] = None,
     ):
         self._internal_client = client is None
-        self._client = client or httpx.AsyncClient()
+        self._client: Optional[httpx.AsyncClient] = client
 
         # Initialize Components
         gap_scanner = GapScannerImpl(
@@ -85,6 +86,8 @@ class EpistemeAsync:
             codex_client=codex_client,
             search_client=search_client,
             similarity_threshold=settings.GAP_SCANNER_SIMILARITY_THRESHOLD,
+            similarity_cache_size=settings.GAP_SCANNER_SIMILARITY_CACHE_SIZE,
+            codex_max_concurrency=settings.CODEX_MAX_CONCURRENCY,
         )
 
         bridge_builder = BridgeBuilderImpl(
@@ -120,9 +123,13 @@ class EpistemeAsync:
             protocol_designer=protocol_designer,
             veritas_client=veritas_client,
             max_retries=settings.MAX_RETRIES,
+            max_parallel_gaps=settings.MAX_PARALLEL_GAPS,
         )
 
     async def __aenter__(self) -> "EpistemeAsync":
+        # Create an owned client inside the event loop that will use it
+        if self._client is None:
+            self._client = httpx.AsyncClient()
         return self
 
     async def __aexit__(
@@ -131,8 +138,9 @@ class EpistemeAsync:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        if self._internal_client:
+        if self._internal_client and self._client is not None:
             await self._client.aclose()
+            self._client = None
         # Ensure engine resources are cleaned up if any
         await self.engine.__aexit__(exc_type, exc_val, exc_tb)
 
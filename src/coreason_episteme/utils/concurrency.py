@@ -0,0 +1,62 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_episteme
+
+"""
+Concurrency helpers for coreason-episteme.
+
+Provides bounded fan-out over independent async calls with fail-fast cancellation.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, List, TypeVar
+
+__all__ = ["map_bounded"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_bounded(func: Callable[[T], Awaitable[R]], items: Iterable[T], limit: int) -> List[R]:
+    """
+    Applies an async function to every item concurrently, with at most `limit` calls in flight.
+
+    Unlike `asyncio.gather`, the first failure cancels every call still pending and is re-raised
+    as-is, so no work keeps running after the caller has seen the error.
+
+    Args:
+        func: The async function to apply.
+        items: The inputs to process.
+        limit: Maximum number of concurrent calls; must be at least 1.
+
+    Returns:
+        List[R]: The results, in the same order as `items`.
+
+    Raises:
+        ValueError: If `limit` is less than 1.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_bounded(item)) for item in items]
+    except ExceptionGroup as errors:
+        # Surface the first failure as a plain exception, as a sequential loop would,
+        # keeping its own traceback and cause.
+        exc = errors.exceptions[0]
+        raise exc.with_traceback(exc.__traceback__) from exc.__cause__
+
+    return [task.result() for task in tasks]
@@ -42,14 +42,27 @@ logger.add(
     ),
 )
 
-# Ensure logs directory exists
-log_path = Path("logs")
-if not log_path.exists():
+
+def _ensure_log_dir(path: str = "logs") -> Path:
+    """
+    Creates the log directory if it does not already exist.
+
+    Args:
+        path: The directory to create.
+
+    Returns:
+        Path: The log directory.
+    """
+    log_path = Path(path)
     log_path.mkdir(parents=True, exist_ok=True)
+    return log_path
+
+
+log_dir = _ensure_log_dir()
 
 # Sink 2: File (JSON, Rotation, Retention)
 logger.add(
-    "logs/app.log",
+    log_dir / "app.log",
     rotation="500 MB",
     retention="10 days",
     serialize=True,
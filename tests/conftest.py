@@ -0,0 +1,65 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_episteme
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from coreason_identity.models import UserContext
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """
+    Groups every test by its module unless it already opts into an xdist group.
+
+    Under --dist=loadgroup this keeps each module on one worker, as --dist=loadfile would, so
+    module-scoped fixtures and event loops are built once, while explicitly grouped modules
+    (e.g. "episteme_models") still share a worker.
+    """
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::", 1)[0]))
+
+
+async def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+@pytest.fixture(scope="session")
+def user_context() -> UserContext:
+    """UserContext is frozen, so a single instance is shared by the whole session."""
+    return UserContext(
+        user_id="test-user",
+        sub="test-user",
+        email="test@coreason.ai",
+        permissions=[],
+        project_context="test",
+    )
+
+
+@pytest.fixture
+def fast_clients() -> Dict[str, Any]:
+    """No-op external client stubs for tests that wire up the service without exercising the clients."""
+    return {
+        "graph_client": SimpleNamespace(find_disconnected_clusters=_noop, find_latent_bridges=_noop),
+        "codex_client": SimpleNamespace(get_semantic_similarity=_noop, validate_target=_noop),
+        "search_client": SimpleNamespace(
+            find_literature_inconsistency=_noop,
+            verify_citation=_noop,
+            check_patent_infringement=_noop,
+            find_disconfirming_evidence=_noop,
+        ),
+        "prism_client": SimpleNamespace(check_druggability=_noop),
+        "inference_client": SimpleNamespace(
+            run_counterfactual_simulation=_noop, run_toxicology_screen=_noop, check_clinical_redundancy=_noop
+        ),
+        "veritas_client": SimpleNamespace(log_trace=_noop),
+    }
@@ -0,0 +1,41 @@
+# Copyright (c) 2025 CoReason, Inc.
+#
+# This software is proprietary and dual-licensed.
+# Licensed under the Prosperity Public License 3.0 (the "License").
+# A copy of the license is available at https://prosperitylicense.com/versions/3.0.0
+# For details, see the LICENSE file.
+# Commercial use beyond a 30-day trial requires a separate license.
+#
+# Source Code: https://github.com/CoReason-AI/coreason_episteme
+
+from typing import Any, Dict
+
+from pydantic import TypeAdapter
+
+from coreason_episteme.models import ConfidenceLevel, Hypothesis
+
+# Built once so every call reuses the compiled validator.
+_HYPOTHESIS_ADAPTER = TypeAdapter(Hypothesis)
+
+_BASE_HYPOTHESIS: Dict[str, Any] = {
+    "id": "H1",
+    "title": "T",
+    "knowledge_gap": "G",
+    "proposed_mechanism": "M",
+    "target_candidate": {"symbol": "S", "ensembl_id": "E", "druggability_score": 1.0, "novelty_score": 1.0},
+    "causal_validation_score": 1.0,
+    "key_counterfactual": "K",
+    "killer_experiment_pico": {"population": "P", "intervention": "I", "comparator": "C", "outcome": "O"},
+    "evidence_chain": [],
+    "confidence": ConfidenceLevel.SPECULATIVE,
+}
+
+
+def make_hypothesis(**overrides: Any) -> Hypothesis:
+    """Builds a validated Hypothesis from baseline test data, replacing any fields given as overrides."""
+    return _HYPOTHESIS_ADAPTER.validate_python({**_BASE_HYPOTHESIS, **overrides})
+
+
+# Validated once at import. Derive trusted variants with BASE_HYP.model_copy(update=...), which skips
+# validation; the copy is shallow, so pass fresh lists for any list field the test mutates.
+BASE_HYP = make_hypothesis()
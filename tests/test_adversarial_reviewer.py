@@ -41,17 +41,6 @@ def mock_search_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def adversarial_reviewer(mock_inference_client: AsyncMock, mock_search_client: AsyncMock) -> AdversarialReviewerImpl:
     strategies: List[ReviewStrategy] = [
@@ -91,7 +80,6 @@ def sample_hypothesis() -> Hypothesis:
     )
 
 
-@pytest.mark.asyncio
 async def test_review_clean_pass(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -117,7 +105,6 @@ async def test_review_clean_pass(
     mock_search_client.find_disconfirming_evidence.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_review_toxicology_fail(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -143,7 +130,6 @@ async def test_review_toxicology_fail(
     assert critique.severity == CritiqueSeverity.FATAL
 
 
-@pytest.mark.asyncio
 async def test_review_skeptic_fail(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -176,7 +162,6 @@ async def test_review_skeptic_fail(
     )
 
 
-@pytest.mark.asyncio
 async def test_review_multiple_critiques(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
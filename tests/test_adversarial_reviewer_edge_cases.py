@@ -40,17 +40,6 @@ def mock_search_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def adversarial_reviewer(mock_inference_client: AsyncMock, mock_search_client: AsyncMock) -> AdversarialReviewerImpl:
     strategies: List[ReviewStrategy] = [
@@ -91,7 +80,6 @@ def sample_hypothesis() -> Hypothesis:
     )
 
 
-@pytest.mark.asyncio
 async def test_review_service_returns_none(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -114,7 +102,6 @@ async def test_review_service_returns_none(
     assert len(reviewed_hypothesis.critiques) == 0
 
 
-@pytest.mark.asyncio
 async def test_review_high_volume_critiques(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -140,7 +127,6 @@ async def test_review_high_volume_critiques(
     assert any("Redundancy 0" in c.content and c.source == "Clinician" for c in reviewed_hypothesis.critiques)
 
 
-@pytest.mark.asyncio
 async def test_review_exception_propagation(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -157,7 +143,6 @@ async def test_review_exception_propagation(
         await adversarial_reviewer.review(sample_hypothesis, context=user_context)
 
 
-@pytest.mark.asyncio
 async def test_review_cumulative_critiques(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -169,17 +154,16 @@ async def test_review_cumulative_critiques(
     Test State: Calling review multiple times appends critiques.
     This verifies that previous critiques are not overwritten.
     """
-    # First run
-    mock_inference_client.run_toxicology_screen.return_value = ["Risk A"]
+    # Toxicology screen results for the first and second run, in call order
+    mock_inference_client.run_toxicology_screen.side_effect = [["Risk A"], ["Risk B"]]
     mock_inference_client.check_clinical_redundancy.return_value = []
     mock_search_client.check_patent_infringement.return_value = []
 
+    # First run
     hypo_v1 = await adversarial_reviewer.review(sample_hypothesis, context=user_context)
     assert len(hypo_v1.critiques) == 1
 
-    # Second run (maybe different results?)
-    mock_inference_client.run_toxicology_screen.return_value = ["Risk B"]
-
+    # Second run
     hypo_v2 = await adversarial_reviewer.review(hypo_v1, context=user_context)
 
     # Should have 2 critiques now (Risk A + Risk B)
@@ -188,7 +172,6 @@ async def test_review_cumulative_critiques(
     assert any("Risk B" in c.content for c in hypo_v2.critiques)
 
 
-@pytest.mark.asyncio
 async def test_review_scientific_skeptic_failure_handling(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -213,7 +196,6 @@ async def test_review_scientific_skeptic_failure_handling(
     assert len(reviewed_hypothesis.critiques) == 0
 
 
-@pytest.mark.asyncio
 async def test_review_all_reviewers_trigger(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
@@ -241,7 +223,6 @@ async def test_review_all_reviewers_trigger(
     assert "Scientific Skeptic" in critique_sources
 
 
-@pytest.mark.asyncio
 async def test_review_empty_strings_robustness(
     adversarial_reviewer: AdversarialReviewerImpl,
     mock_inference_client: AsyncMock,
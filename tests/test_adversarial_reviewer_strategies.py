@@ -67,17 +67,6 @@ class CustomCritiqueStrategy:
 # --- Fixtures ---
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def sample_hypothesis() -> Hypothesis:
     return Hypothesis(
@@ -98,7 +87,6 @@ def sample_hypothesis() -> Hypothesis:
 # --- Tests ---
 
 
-@pytest.mark.asyncio
 async def test_reviewer_with_no_strategies(sample_hypothesis: Hypothesis, user_context: UserContext) -> None:
     """
     Edge Case: Reviewer initialized with empty list of strategies.
@@ -109,7 +97,6 @@ async def test_reviewer_with_no_strategies(sample_hypothesis: Hypothesis, user_c
     assert len(result.critiques) == 0
 
 
-@pytest.mark.asyncio
 async def test_reviewer_with_malfunctioning_strategy(sample_hypothesis: Hypothesis, user_context: UserContext) -> None:
     """
     Edge Case: One strategy raises an exception.
@@ -126,7 +113,6 @@ async def test_reviewer_with_malfunctioning_strategy(sample_hypothesis: Hypothes
         await reviewer.review(sample_hypothesis, context=user_context)
 
 
-@pytest.mark.asyncio
 async def test_reviewer_with_none_returning_strategy(sample_hypothesis: Hypothesis, user_context: UserContext) -> None:
     """
     Edge Case: Strategy violates protocol and returns None.
@@ -141,7 +127,6 @@ async def test_reviewer_with_none_returning_strategy(sample_hypothesis: Hypothes
         await reviewer.review(sample_hypothesis, context=user_context)
 
 
-@pytest.mark.asyncio
 async def test_reviewer_complex_mix(sample_hypothesis: Hypothesis, user_context: UserContext) -> None:
     """
     Complex Scenario: Multiple strategies returning mixed critiques.
@@ -44,17 +44,6 @@ def mock_search_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def bridge_builder(
     mock_graph_client: AsyncMock,
@@ -70,7 +59,6 @@ def bridge_builder(
     )
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_success(
     bridge_builder: BridgeBuilderImpl,
     mock_graph_client: AsyncMock,
@@ -106,9 +94,9 @@ async def test_generate_hypothesis_success(
     result = await bridge_builder.generate_hypothesis(gap, context=user_context)
 
     # Verify Result Structure
-    assert isinstance(result, BridgeResult)
+    assert type(result) is BridgeResult
     assert result.hypothesis is not None
-    assert isinstance(result.hypothesis, Hypothesis)
+    assert type(result.hypothesis) is Hypothesis
     assert result.hypothesis.confidence == ConfidenceLevel.SPECULATIVE
     assert result.hypothesis.target_candidate.symbol == "GeneX"
 
@@ -126,7 +114,6 @@ async def test_generate_hypothesis_success(
     mock_search_client.verify_citation.assert_called_with(expected_claim)
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_citation_verification_fail(
     bridge_builder: BridgeBuilderImpl,
     mock_graph_client: AsyncMock,
@@ -165,7 +152,6 @@ async def test_generate_hypothesis_citation_verification_fail(
     mock_search_client.verify_citation.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_no_bridges(
     bridge_builder: BridgeBuilderImpl, mock_graph_client: AsyncMock, user_context: UserContext
 ) -> None:
@@ -184,7 +170,6 @@ async def test_generate_hypothesis_no_bridges(
     assert result.considered_candidates == []
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_no_druggable_bridges(
     bridge_builder: BridgeBuilderImpl,
     mock_graph_client: AsyncMock,
@@ -214,7 +199,6 @@ async def test_generate_hypothesis_no_druggable_bridges(
     assert "GeneY" in result.considered_candidates
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_codex_validation_fail(
     bridge_builder: BridgeBuilderImpl,
     mock_graph_client: AsyncMock,
@@ -246,7 +230,6 @@ async def test_generate_hypothesis_codex_validation_fail(
     assert "GeneZ" in result.considered_candidates
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_insufficient_nodes(
     bridge_builder: BridgeBuilderImpl, user_context: UserContext
 ) -> None:
@@ -262,7 +245,6 @@ async def test_generate_hypothesis_insufficient_nodes(
     assert result.bridges_found_count == 0
 
 
-@pytest.mark.asyncio
 async def test_generate_hypothesis_excluded_targets(
     bridge_builder: BridgeBuilderImpl,
     mock_graph_client: AsyncMock,
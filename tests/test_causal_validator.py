@@ -27,23 +27,11 @@ def mock_inference_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def causal_validator(mock_inference_client: AsyncMock) -> CausalValidatorImpl:
     return CausalValidatorImpl(inference_client=mock_inference_client)
 
 
-@pytest.mark.asyncio
 async def test_validate_success(
     causal_validator: CausalValidatorImpl,
     mock_inference_client: AsyncMock,
@@ -24,8 +24,11 @@ def test_settings_defaults() -> None:
         settings = Settings()
         assert settings.LOG_LEVEL == "INFO"
         assert settings.MAX_RETRIES == 3
+        assert settings.MAX_PARALLEL_GAPS == 8
         assert settings.GAP_SCANNER_SIMILARITY_THRESHOLD == 0.75
+        assert settings.GAP_SCANNER_SIMILARITY_CACHE_SIZE == 10_000
         assert settings.DRUGGABILITY_THRESHOLD == 0.5
+        assert settings.CODEX_MAX_CONCURRENCY == 32
 
 
 def test_settings_override_via_env() -> None:
@@ -34,6 +37,7 @@ def test_settings_override_via_env() -> None:
         "LOG_LEVEL": "DEBUG",
         "MAX_RETRIES": "5",
         "GAP_SCANNER_SIMILARITY_THRESHOLD": "0.8",
+        "GAP_SCANNER_SIMILARITY_CACHE_SIZE": "50",
         "DRUGGABILITY_THRESHOLD": "0.1",
     }
     with patch.dict(os.environ, env_vars, clear=True):
@@ -41,6 +45,7 @@ def test_settings_override_via_env() -> None:
         assert settings.LOG_LEVEL == "DEBUG"
         assert settings.MAX_RETRIES == 5
         assert settings.GAP_SCANNER_SIMILARITY_THRESHOLD == 0.8
+        assert settings.GAP_SCANNER_SIMILARITY_CACHE_SIZE == 50
         assert settings.DRUGGABILITY_THRESHOLD == 0.1
 
 
@@ -54,6 +59,22 @@ def test_settings_invalid_types() -> None:
             Settings()
 
 
+@pytest.mark.parametrize("name", ["CODEX_MAX_CONCURRENCY", "MAX_PARALLEL_GAPS"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_settings_rejects_non_positive_concurrency(name: str, value: str) -> None:
+    """Test that concurrency limits must be at least 1."""
+    with patch.dict(os.environ, {name: value}, clear=True):
+        with pytest.raises(ValidationError):
+            Settings()
+
+
+def test_settings_rejects_negative_similarity_cache_size() -> None:
+    """Test that the similarity cache size cannot be negative."""
+    with patch.dict(os.environ, {"GAP_SCANNER_SIMILARITY_CACHE_SIZE": "-1"}, clear=True):
+        with pytest.raises(ValidationError):
+            Settings()
+
+
 def test_settings_case_insensitivity() -> None:
     """Test that environment variables are case-insensitive."""
     env_vars = {
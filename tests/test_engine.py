@@ -8,13 +8,14 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
-from typing import List, Optional, cast
+import asyncio
+from typing import Any, Dict, List, Optional, cast
 
 import pytest
 from coreason_identity.models import UserContext
 
 from coreason_episteme.engine import EpistemeEngineAsync
-from coreason_episteme.models import BridgeResult, KnowledgeGap
+from coreason_episteme.models import BridgeResult, KnowledgeGap, KnowledgeGapType
 from tests.mocks import (
     MockAdversarialReviewer,
     MockBridgeBuilder,
@@ -37,18 +38,6 @@ def engine() -> EpistemeEngineAsync:
     )
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
-@pytest.mark.asyncio
 async def test_engine_run_happy_path(engine: EpistemeEngineAsync, user_context: UserContext) -> None:
     """Test the full engine loop with a valid target."""
     async with engine:
@@ -77,7 +66,6 @@ async def test_engine_run_happy_path(engine: EpistemeEngineAsync, user_context:
     assert trace["bridge_id"] is not None
 
 
-@pytest.mark.asyncio
 async def test_engine_run_no_gaps(engine: EpistemeEngineAsync, user_context: UserContext) -> None:
     """Test engine when no gaps are found."""
     async with engine:
@@ -85,7 +73,6 @@ async def test_engine_run_no_gaps(engine: EpistemeEngineAsync, user_context: Use
     assert len(results) == 0
 
 
-@pytest.mark.asyncio
 async def test_engine_run_low_causal_score(engine: EpistemeEngineAsync, user_context: UserContext) -> None:
     """Test that hypotheses with low causal scores are filtered out."""
 
@@ -122,7 +109,6 @@ async def test_engine_run_low_causal_score(engine: EpistemeEngineAsync, user_con
     assert trace["bridge_id"] is not None
 
 
-@pytest.mark.asyncio
 async def test_engine_run_refinement_loop(engine: EpistemeEngineAsync, user_context: UserContext) -> None:
     """
     Test the Refinement Loop:
@@ -178,7 +164,6 @@ async def test_engine_run_refinement_loop(engine: EpistemeEngineAsync, user_cont
     assert trace["refinement_retries"] > 0
 
 
-@pytest.mark.asyncio
 async def test_engine_run_bridge_failure(engine: EpistemeEngineAsync, user_context: UserContext) -> None:
     """Test engine when bridge builder fails to generate a hypothesis."""
 
@@ -204,7 +189,109 @@ async def test_engine_run_bridge_failure(engine: EpistemeEngineAsync, user_conte
     # Verify Trace
 
 
-@pytest.mark.asyncio
+async def test_engine_run_gaps_concurrently(user_context: UserContext) -> None:
+    """Test that gaps are refined concurrently up to max_parallel_gaps, preserving gap order."""
+    gaps = [
+        KnowledgeGap(description=f"Gap {i}", type=KnowledgeGapType.CLUSTER_DISCONNECT, source_nodes=[])
+        for i in range(5)
+    ]
+
+    class MultiGapScanner(MockGapScanner):
+        async def scan(self, target: str, context: UserContext) -> List[KnowledgeGap]:
+            return gaps
+
+    in_flight = 0
+    peak = 0
+
+    class SlowBridgeBuilder(MockBridgeBuilder):
+        async def generate_hypothesis(
+            self, gap: KnowledgeGap, context: UserContext, excluded_targets: Optional[List[str]] = None
+        ) -> BridgeResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later gaps finish first, so ordering must come from gather, not completion.
+            await asyncio.sleep(0.01 * (len(gaps) - gaps.index(gap)))
+            in_flight -= 1
+            return await super().generate_hypothesis(gap, context, excluded_targets)
+
+    parallel_engine = EpistemeEngineAsync(
+        gap_scanner=MultiGapScanner(),
+        bridge_builder=SlowBridgeBuilder(),
+        causal_validator=MockCausalValidator(),
+        adversarial_reviewer=MockAdversarialReviewer(),
+        protocol_designer=MockProtocolDesigner(),
+        veritas_client=MockVeritasClient(),
+        max_parallel_gaps=2,
+    )
+
+    async with parallel_engine:
+        results = await parallel_engine.run("TargetX", context=user_context)
+
+    assert peak == 2
+    assert [h.knowledge_gap for h in results] == [gap.description for gap in gaps]
+    veritas = cast(MockVeritasClient, parallel_engine.veritas_client)
+    assert len(veritas.traces) == len(gaps)
+
+
+async def test_engine_run_failure_cancels_remaining_gaps(user_context: UserContext) -> None:
+    """Test that an error escaping one gap stops the run and cancels the other gaps."""
+    gaps = [
+        KnowledgeGap(description=f"Gap {i}", type=KnowledgeGapType.CLUSTER_DISCONNECT, source_nodes=[])
+        for i in range(3)
+    ]
+
+    class MultiGapScanner(MockGapScanner):
+        async def scan(self, target: str, context: UserContext) -> List[KnowledgeGap]:
+            return gaps
+
+    class FailFirstBridgeBuilder(MockBridgeBuilder):
+        async def generate_hypothesis(
+            self, gap: KnowledgeGap, context: UserContext, excluded_targets: Optional[List[str]] = None
+        ) -> BridgeResult:
+            if gap is gaps[0]:
+                raise RuntimeError("bridge failed")
+            await asyncio.sleep(0.01)
+            return await super().generate_hypothesis(gap, context, excluded_targets)
+
+    class FailingErrorTraceVeritas(MockVeritasClient):
+        async def log_trace(self, hypothesis_id: str, trace_data: Dict[str, Any]) -> None:
+            if hypothesis_id.startswith("error-gap"):
+                raise ConnectionError("veritas down")
+            await super().log_trace(hypothesis_id, trace_data)
+
+    failing_engine = EpistemeEngineAsync(
+        gap_scanner=MultiGapScanner(),
+        bridge_builder=FailFirstBridgeBuilder(),
+        causal_validator=MockCausalValidator(),
+        adversarial_reviewer=MockAdversarialReviewer(),
+        protocol_designer=MockProtocolDesigner(),
+        veritas_client=FailingErrorTraceVeritas(),
+    )
+
+    with pytest.raises(ConnectionError, match="veritas down"):
+        await failing_engine.run("TargetX", context=user_context)
+
+    # The sibling gaps were cancelled, so they never log a trace afterwards
+    await asyncio.sleep(0.02)
+    veritas = cast(MockVeritasClient, failing_engine.veritas_client)
+    assert veritas.traces == []
+
+
+def test_engine_rejects_non_positive_parallelism() -> None:
+    """Test that max_parallel_gaps below 1 is rejected instead of hanging run()."""
+    with pytest.raises(ValueError, match="max_parallel_gaps must be at least 1"):
+        EpistemeEngineAsync(
+            gap_scanner=MockGapScanner(),
+            bridge_builder=MockBridgeBuilder(),
+            causal_validator=MockCausalValidator(),
+            adversarial_reviewer=MockAdversarialReviewer(),
+            protocol_designer=MockProtocolDesigner(),
+            veritas_client=MockVeritasClient(),
+            max_parallel_gaps=0,
+        )
+
+
 async def test_engine_missing_context(engine: EpistemeEngineAsync) -> None:
     """Test that missing context raises ValueError."""
     with pytest.raises(ValueError, match="context is required"):
@@ -48,18 +48,6 @@ def engine() -> EpistemeEngineAsync:
     )
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
-@pytest.mark.asyncio
 async def test_refinement_max_retries_exceeded(user_context: UserContext) -> None:
     """
     Edge Case: The system keeps finding toxic targets until max_retries is hit.
@@ -107,7 +95,6 @@ async def test_refinement_max_retries_exceeded(user_context: UserContext) -> Non
     assert len(results) == 0
 
 
-@pytest.mark.asyncio
 async def test_refinement_candidate_exhaustion(user_context: UserContext) -> None:
     """
     Edge Case: BridgeBuilder runs out of candidates before max_retries.
@@ -158,7 +145,6 @@ async def test_refinement_candidate_exhaustion(user_context: UserContext) -> Non
     assert len(results) == 0
 
 
-@pytest.mark.asyncio
 async def test_complex_severity_threshold(user_context: UserContext) -> None:
     """
     Complex Scenario: "The Unicorn Hunt"
@@ -238,7 +224,6 @@ async def test_complex_severity_threshold(user_context: UserContext) -> None:
     assert not any(c.severity == CritiqueSeverity.FATAL for c in winner.critiques)
 
 
-@pytest.mark.asyncio
 async def test_multi_gap_mixed_outcomes(user_context: UserContext) -> None:
     """
     Scenario: The GapScanner returns 3 gaps.
@@ -353,7 +338,6 @@ async def test_multi_gap_mixed_outcomes(user_context: UserContext) -> None:
     assert traces[2]["id"] == "hyp-C"
 
 
-@pytest.mark.asyncio
 async def test_deep_refinement_history_logging(user_context: UserContext) -> None:
     """
     Scenario:
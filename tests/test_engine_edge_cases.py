@@ -37,18 +37,6 @@ def engine() -> EpistemeEngineAsync:
     )
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
-@pytest.mark.asyncio
 async def test_engine_exception_handling(user_context: UserContext) -> None:
     """
     Edge Case: A component raises an unhandled exception.
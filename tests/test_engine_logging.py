@@ -28,17 +28,6 @@ def mock_veritas() -> MockVeritasClient:
     return MockVeritasClient()
 
 
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
 @pytest.fixture
 def engine(mock_veritas: MockVeritasClient) -> EpistemeEngineAsync:
     # Attempt to inject veritas_client - this will fail until EpistemeEngine is updated
@@ -52,7 +41,6 @@ def engine(mock_veritas: MockVeritasClient) -> EpistemeEngineAsync:
     )
 
 
-@pytest.mark.asyncio
 async def test_engine_lifecycle_logging(
     engine: EpistemeEngineAsync, mock_veritas: MockVeritasClient, user_context: UserContext
 ) -> None:
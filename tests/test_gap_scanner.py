@@ -8,47 +8,46 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
+import asyncio
+from typing import Iterator, Optional
 from unittest.mock import AsyncMock
 
 import pytest
 from coreason_identity.models import UserContext
 
 from coreason_episteme.components.gap_scanner import GapScannerImpl
-from coreason_episteme.interfaces import GapScanner
-from coreason_episteme.models import KnowledgeGap, KnowledgeGapType
+from coreason_episteme.interfaces import BatchCodexClient
+from coreason_episteme.models import GeneticTarget, KnowledgeGap, KnowledgeGapType
 from tests.mocks import MockGapScanner
 
-
-@pytest.fixture
-def user_context() -> UserContext:
-    return UserContext(
-        user_id="test-user",
-        sub="test-user",
-        email="test@coreason.ai",
-        permissions=[],
-        project_context="test",
-    )
-
-
-def test_interface_definition() -> None:
-    """Test that GapScanner interface is importable."""
-    assert GapScanner is not None
+# The scanner only reads these inputs, so one instance of each is shared by all tests.
+_LIT_GAP = KnowledgeGap(
+    description="Lit Discrepancy",
+    type=KnowledgeGapType.LITERATURE_INCONSISTENCY,
+    source_nodes=["PMID:1"],
+)
+_CLUSTERS_AB = [
+    {
+        "cluster_a_id": "ID_A",
+        "cluster_b_id": "ID_B",
+        "cluster_a_name": "Cluster A",
+        "cluster_b_name": "Cluster B",
+    }
+]
 
 
-@pytest.mark.asyncio
 async def test_mock_gap_scanner_scan_found(user_context: UserContext) -> None:
     """Test that the MockGapScanner returns a gap when one is expected."""
     scanner = MockGapScanner()
     gaps = await scanner.scan("DiseaseX", context=user_context)
 
     assert len(gaps) == 1
-    assert isinstance(gaps[0], KnowledgeGap)
+    assert type(gaps[0]) is KnowledgeGap
     assert gaps[0].id is not None  # Verify ID is generated
     assert "DiseaseX" in gaps[0].description
     assert gaps[0].source_nodes == ["PMID:123456", "PMID:789012"]
 
 
-@pytest.mark.asyncio
 async def test_mock_gap_scanner_scan_not_found(user_context: UserContext) -> None:
     """Test that the MockGapScanner returns an empty list for 'CleanTarget'."""
     scanner = MockGapScanner()
@@ -60,22 +59,23 @@ async def test_mock_gap_scanner_scan_not_found(user_context: UserContext) -> Non
 # --- GapScannerImpl Tests ---
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_graph_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_codex_client() -> AsyncMock:
-    return AsyncMock()
+    # Spec'd so the scanner recognises it as a batch-capable client
+    return AsyncMock(spec=BatchCodexClient)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_search_client() -> AsyncMock:
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gap_scanner_impl(
     mock_graph_client: AsyncMock,
     mock_codex_client: AsyncMock,
@@ -88,7 +88,20 @@ def gap_scanner_impl(
     )
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    gap_scanner_impl: GapScannerImpl,
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    mock_search_client: AsyncMock,
+) -> Iterator[None]:
+    """Resets the module-scoped client mocks and the scanner's similarity cache after each test."""
+    yield
+    gap_scanner_impl.clear_similarity_cache()
+    for mock in (mock_graph_client, mock_codex_client, mock_search_client):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 async def test_scan_cluster_gap_found(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -98,15 +111,8 @@ async def test_scan_cluster_gap_found(
 ) -> None:
     """Test that a gap is created when clusters are found with high similarity."""
     # Setup
-    mock_graph_client.find_disconnected_clusters.return_value = [
-        {
-            "cluster_a_id": "ID_A",
-            "cluster_b_id": "ID_B",
-            "cluster_a_name": "Cluster A",
-            "cluster_b_name": "Cluster B",
-        }
-    ]
-    mock_codex_client.get_semantic_similarity.return_value = 0.8  # > 0.75
+    mock_graph_client.find_disconnected_clusters.return_value = _CLUSTERS_AB
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.8]  # > 0.75
     mock_search_client.find_literature_inconsistency.return_value = []
 
     # Execute
@@ -122,10 +128,9 @@ async def test_scan_cluster_gap_found(
     assert gap.source_nodes == ["ID_A", "ID_B"]
 
     mock_graph_client.find_disconnected_clusters.assert_called_with({"target": "TargetX"})
-    mock_codex_client.get_semantic_similarity.assert_called_with("ID_A", "ID_B")
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_once_with([("ID_A", "ID_B")])
 
 
-@pytest.mark.asyncio
 async def test_scan_cluster_gap_filtered_low_similarity(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -135,15 +140,8 @@ async def test_scan_cluster_gap_filtered_low_similarity(
 ) -> None:
     """Test that no gap is created when similarity is low."""
     # Setup
-    mock_graph_client.find_disconnected_clusters.return_value = [
-        {
-            "cluster_a_id": "ID_A",
-            "cluster_b_id": "ID_B",
-            "cluster_a_name": "Cluster A",
-            "cluster_b_name": "Cluster B",
-        }
-    ]
-    mock_codex_client.get_semantic_similarity.return_value = 0.5  # < 0.75
+    mock_graph_client.find_disconnected_clusters.return_value = _CLUSTERS_AB
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.5]  # < 0.75
     mock_search_client.find_literature_inconsistency.return_value = []
 
     # Execute
@@ -153,7 +151,6 @@ async def test_scan_cluster_gap_filtered_low_similarity(
     assert len(gaps) == 0
 
 
-@pytest.mark.asyncio
 async def test_scan_literature_gap_found(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -164,23 +161,19 @@ async def test_scan_literature_gap_found(
     """Test that literature inconsistencies are returned."""
     # Setup
     mock_graph_client.find_disconnected_clusters.return_value = []
-    lit_gap = KnowledgeGap(
-        description="Lit Discrepancy",
-        type=KnowledgeGapType.LITERATURE_INCONSISTENCY,
-        source_nodes=["PMID:1"],
-    )
-    mock_search_client.find_literature_inconsistency.return_value = [lit_gap]
+    mock_search_client.find_literature_inconsistency.return_value = [_LIT_GAP]
 
     # Execute
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
 
     # Verify
     assert len(gaps) == 1
-    assert gaps[0] == lit_gap
+    assert gaps[0] == _LIT_GAP
     mock_search_client.find_literature_inconsistency.assert_called_with("TargetX")
+    # No cluster pairs means no Codex round-trip at all
+    mock_codex_client.get_semantic_similarity_batch.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_scan_combined_results(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -191,13 +184,9 @@ async def test_scan_combined_results(
     """Test that results from both sources are combined."""
     # Setup
     mock_graph_client.find_disconnected_clusters.return_value = [{"cluster_a_id": "A", "cluster_b_id": "B"}]
-    mock_codex_client.get_semantic_similarity.return_value = 0.9
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9]
 
-    lit_gap = KnowledgeGap(
-        description="Lit Discrepancy",
-        type=KnowledgeGapType.LITERATURE_INCONSISTENCY,
-    )
-    mock_search_client.find_literature_inconsistency.return_value = [lit_gap]
+    mock_search_client.find_literature_inconsistency.return_value = [_LIT_GAP]
 
     # Execute
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
@@ -209,7 +198,6 @@ async def test_scan_combined_results(
     assert KnowledgeGapType.LITERATURE_INCONSISTENCY in types
 
 
-@pytest.mark.asyncio
 async def test_scan_malformed_cluster_data(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -227,10 +215,9 @@ async def test_scan_malformed_cluster_data(
 
     # Verify
     assert len(gaps) == 0
-    mock_codex_client.get_semantic_similarity.assert_not_called()
+    mock_codex_client.get_semantic_similarity_batch.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_scan_boundary_condition(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -240,7 +227,7 @@ async def test_scan_boundary_condition(
 ) -> None:
     """Test boundary condition where similarity is exactly 0.75."""
     mock_graph_client.find_disconnected_clusters.return_value = [{"cluster_a_id": "A", "cluster_b_id": "B"}]
-    mock_codex_client.get_semantic_similarity.return_value = 0.75
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.75]
     mock_search_client.find_literature_inconsistency.return_value = []
 
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
@@ -249,7 +236,6 @@ async def test_scan_boundary_condition(
     assert gaps[0].type == KnowledgeGapType.CLUSTER_DISCONNECT
 
 
-@pytest.mark.asyncio
 async def test_scan_robustness_malformed_data(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -269,10 +255,9 @@ async def test_scan_robustness_malformed_data(
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
 
     assert len(gaps) == 0
-    mock_codex_client.get_semantic_similarity.assert_not_called()
+    mock_codex_client.get_semantic_similarity_batch.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_scan_complex_scenario(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -287,18 +272,10 @@ async def test_scan_complex_scenario(
         {"cluster_a_id": "A3"},  # Malformed
     ]
 
-    def similarity_side_effect(a: str, b: str) -> float:
-        if a == "A1" and b == "B1":
-            return 0.8
-        if a == "A2" and b == "B2":
-            return 0.4
-        return 0.0
+    similarities = {("A1", "B1"): 0.8, ("A2", "B2"): 0.4}
+    mock_codex_client.get_semantic_similarity_batch.side_effect = lambda pairs: [similarities[p] for p in pairs]
 
-    mock_codex_client.get_semantic_similarity.side_effect = similarity_side_effect
-
-    mock_search_client.find_literature_inconsistency.return_value = [
-        KnowledgeGap(description="Lit Gap", type=KnowledgeGapType.LITERATURE_INCONSISTENCY, source_nodes=["PMID:1"])
-    ]
+    mock_search_client.find_literature_inconsistency.return_value = [_LIT_GAP]
 
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
 
@@ -307,7 +284,6 @@ async def test_scan_complex_scenario(
     assert any(g.type == KnowledgeGapType.LITERATURE_INCONSISTENCY for g in gaps)
 
 
-@pytest.mark.asyncio
 async def test_scan_duplicate_symmetry(
     gap_scanner_impl: GapScannerImpl,
     mock_graph_client: AsyncMock,
@@ -317,13 +293,13 @@ async def test_scan_duplicate_symmetry(
 ) -> None:
     """
     Test behavior when symmetric pairs (A-B and B-A) are returned.
-    Current behavior: Both are reported.
+    Current behavior: Both are reported, but Codex scores the pair only once.
     """
     mock_graph_client.find_disconnected_clusters.return_value = [
         {"cluster_a_id": "A", "cluster_b_id": "B", "cluster_a_name": "Cluster A", "cluster_b_name": "Cluster B"},
         {"cluster_a_id": "B", "cluster_b_id": "A", "cluster_a_name": "Cluster B", "cluster_b_name": "Cluster A"},
     ]
-    mock_codex_client.get_semantic_similarity.return_value = 0.9
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9]
     mock_search_client.find_literature_inconsistency.return_value = []
 
     gaps = await gap_scanner_impl.scan("TargetX", context=user_context)
@@ -331,3 +307,186 @@ async def test_scan_duplicate_symmetry(
     assert len(gaps) == 2
     assert gaps[0].source_nodes == ["A", "B"]
     assert gaps[1].source_nodes == ["B", "A"]
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_once_with([("A", "B")])
+
+
+async def test_scan_reuses_cached_similarity(
+    gap_scanner_impl: GapScannerImpl,
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    mock_search_client: AsyncMock,
+    user_context: UserContext,
+) -> None:
+    """Test that repeated scans only ask Codex about pairs it has not scored yet."""
+    mock_graph_client.find_disconnected_clusters.return_value = _CLUSTERS_AB
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.8]
+    mock_search_client.find_literature_inconsistency.return_value = []
+
+    first = await gap_scanner_impl.scan("TargetX", context=user_context)
+    second = await gap_scanner_impl.scan("TargetX", context=user_context)
+
+    assert len(first) == len(second) == 1
+    assert second[0].source_nodes == ["ID_A", "ID_B"]
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_once()
+
+    # Only the unseen pair is sent once new clusters show up
+    mock_graph_client.find_disconnected_clusters.return_value = _CLUSTERS_AB + [
+        {"cluster_a_id": "ID_C", "cluster_b_id": "ID_A"}
+    ]
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9]
+
+    third = await gap_scanner_impl.scan("TargetX", context=user_context)
+
+    assert len(third) == 2
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_with([("ID_A", "ID_C")])
+
+    # Clearing the cache forces a fresh lookup
+    gap_scanner_impl.clear_similarity_cache()
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.8, 0.9]
+    await gap_scanner_impl.scan("TargetX", context=user_context)
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_with([("ID_A", "ID_B"), ("ID_A", "ID_C")])
+
+
+async def test_scan_similarity_cache_is_bounded(
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    mock_search_client: AsyncMock,
+    user_context: UserContext,
+) -> None:
+    """Test that the least recently used similarity is evicted once the cache is full."""
+    scanner = GapScannerImpl(
+        graph_client=mock_graph_client,
+        codex_client=mock_codex_client,
+        search_client=mock_search_client,
+        similarity_cache_size=1,
+    )
+    mock_graph_client.find_disconnected_clusters.return_value = [
+        {"cluster_a_id": "A", "cluster_b_id": "B"},
+        {"cluster_a_id": "C", "cluster_b_id": "D"},
+    ]
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9, 0.5]
+    mock_search_client.find_literature_inconsistency.return_value = []
+
+    gaps = await scanner.scan("TargetX", context=user_context)
+
+    # Both pairs are still scored correctly even though only one fits in the cache
+    assert [g.source_nodes for g in gaps] == [["A", "B"]]
+
+    # (A, B) was evicted, (C, D) is kept
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9]
+    gaps = await scanner.scan("TargetX", context=user_context)
+
+    assert [g.source_nodes for g in gaps] == [["A", "B"]]
+    mock_codex_client.get_semantic_similarity_batch.assert_awaited_with([("A", "B")])
+
+
+def test_gap_scanner_rejects_negative_cache_size(
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    mock_search_client: AsyncMock,
+) -> None:
+    """Test that a negative similarity cache size is rejected at construction."""
+    with pytest.raises(ValueError, match="similarity_cache_size must be non-negative"):
+        GapScannerImpl(
+            graph_client=mock_graph_client,
+            codex_client=mock_codex_client,
+            search_client=mock_search_client,
+            similarity_cache_size=-1,
+        )
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_gap_scanner_rejects_non_positive_codex_concurrency(
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    mock_search_client: AsyncMock,
+    limit: int,
+) -> None:
+    """Test that the Codex concurrency limit must be at least 1."""
+    with pytest.raises(ValueError, match="codex_max_concurrency must be at least 1"):
+        GapScannerImpl(
+            graph_client=mock_graph_client,
+            codex_client=mock_codex_client,
+            search_client=mock_search_client,
+            codex_max_concurrency=limit,
+        )
+
+
+async def test_scan_falls_back_to_per_pair_similarity(
+    mock_graph_client: AsyncMock,
+    mock_search_client: AsyncMock,
+    user_context: UserContext,
+) -> None:
+    """Test a duck-typed Codex client without a batch method, bounded by codex_max_concurrency."""
+
+    class PerPairCodexClient:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.peak = 0
+
+        async def get_semantic_similarity(self, entity1: str, entity2: str) -> float:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return 0.9 if entity2 == "B0" else 0.1
+
+        async def validate_target(self, symbol: str) -> Optional[GeneticTarget]:
+            return None
+
+    codex = PerPairCodexClient()
+    scanner = GapScannerImpl(
+        graph_client=mock_graph_client,
+        codex_client=codex,
+        search_client=mock_search_client,
+        codex_max_concurrency=2,
+    )
+    mock_graph_client.find_disconnected_clusters.return_value = [
+        {"cluster_a_id": "A", "cluster_b_id": f"B{i}"} for i in range(5)
+    ]
+    mock_search_client.find_literature_inconsistency.return_value = []
+
+    gaps = await scanner.scan("TargetX", context=user_context)
+
+    assert [g.source_nodes for g in gaps] == [["A", "B0"]]
+    assert codex.peak == 2
+
+
+async def test_scan_rejects_mismatched_batch_scores(
+    gap_scanner_impl: GapScannerImpl,
+    mock_graph_client: AsyncMock,
+    mock_codex_client: AsyncMock,
+    user_context: UserContext,
+) -> None:
+    """Test that a batch response with the wrong number of scores fails with a clear error."""
+    mock_graph_client.find_disconnected_clusters.return_value = [
+        {"cluster_a_id": "A", "cluster_b_id": "B"},
+        {"cluster_a_id": "A", "cluster_b_id": "C"},
+    ]
+    mock_codex_client.get_semantic_similarity_batch.return_value = [0.9]
+
+    with pytest.raises(ValueError, match="Codex returned 1 similarity scores for 2 pairs"):
+        await gap_scanner_impl.scan("TargetX", context=user_context)
+
+
+async def test_scan_plain_async_mock_codex_uses_per_pair_similarity(
+    mock_graph_client: AsyncMock,
+    mock_search_client: AsyncMock,
+    user_context: UserContext,
+) -> None:
+    """Test that a client not implementing BatchCodexClient is never sent a batch call."""
+    codex = AsyncMock()
+    codex.get_semantic_similarity.return_value = 0.9
+    scanner = GapScannerImpl(
+        graph_client=mock_graph_client,
+        codex_client=codex,
+        search_client=mock_search_client,
+    )
+    mock_graph_client.find_disconnected_clusters.return_value = _CLUSTERS_AB
+    mock_search_client.find_literature_inconsistency.return_value = []
+
+    gaps = await scanner.scan("TargetX", context=user_context)
+
+    assert [g.source_nodes for g in gaps] == [["ID_A", "ID_B"]]
+    codex.get_semantic_similarity.assert_awaited_once_with("ID_A", "ID_B")
+    codex.get_semantic_similarity_batch.assert_not_called()
@@ -45,17 +45,6 @@ class TestIntegrationConfigOverrides:
     def mock_prism_client(self) -> Mock:
         return AsyncMock(spec=PrismClient)
 
-    @pytest.fixture
-    def user_context(self) -> UserContext:
-        return UserContext(
-            user_id="test-user",
-            sub="test-user",
-            email="test@coreason.ai",
-            permissions=[],
-            project_context="test",
-        )
-
-    @pytest.mark.asyncio
     async def test_gap_scanner_similarity_threshold_override(
         self,
         mock_graph_client: Mock,
@@ -90,6 +79,8 @@ class TestIntegrationConfigOverrides:
         )
         gaps_strict = await scanner_strict.scan("DiseaseX", context=user_context)
         assert len(gaps_strict) == 0
+        # The protocol-spec mock has no batch method, so the scanner scores pairs one by one
+        mock_codex_client.get_semantic_similarity.assert_awaited_once_with("C1", "C2")
 
         # Case 2: Lowered Threshold (0.5) -> Should find 1 gap (0.6 >= 0.5)
         scanner_lax = GapScannerImpl(
@@ -101,8 +92,8 @@ class TestIntegrationConfigOverrides:
         gaps_lax = await scanner_lax.scan("DiseaseX", context=user_context)
         assert len(gaps_lax) == 1
         assert gaps_lax[0].type == KnowledgeGapType.CLUSTER_DISCONNECT
+        assert mock_codex_client.get_semantic_similarity.await_count == 2
 
-    @pytest.mark.asyncio
     async def test_bridge_builder_druggability_threshold_override(
         self,
         mock_graph_client: Mock,
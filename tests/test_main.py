@@ -1,75 +1,98 @@
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from coreason_episteme.main import Episteme, EpistemeAsync, generate_hypothesis, hello_world
 
 
-@pytest.fixture
-def mock_clients() -> Dict[str, MagicMock]:
-    return {
-        "graph_client": MagicMock(),
-        "codex_client": MagicMock(),
-        "search_client": MagicMock(),
-        "prism_client": MagicMock(),
-        "inference_client": MagicMock(),
-        "veritas_client": MagicMock(),
-    }
+class _FakeAsyncClient:
+    """Minimal stand-in for httpx.AsyncClient exposing only what EpistemeAsync touches."""
+
+    def __init__(self) -> None:
+        self.aclose = AsyncMock()
+
+
+def _offline_handler(request: httpx.Request) -> httpx.Response:
+    """Answers every request locally so real httpx clients never touch the network."""
+    return httpx.Response(404)
 
 
 def test_hello_world() -> None:
     assert hello_world() == "Hello World!"
 
 
-@pytest.mark.asyncio
-async def test_episteme_async_context_manager(mock_clients: Dict[str, Any]) -> None:
-    # Mock httpx.AsyncClient to verify aclose is called
+async def test_episteme_async_context_manager(fast_clients: Dict[str, Any]) -> None:
+    # Mock httpx.AsyncClient to verify the owned client's lifecycle
     with patch("httpx.AsyncClient") as MockClient:
-        mock_http_client = AsyncMock()
+        mock_http_client = _FakeAsyncClient()
         MockClient.return_value = mock_http_client
 
-        async with EpistemeAsync(**mock_clients) as svc:
-            assert svc is not None
+        svc = EpistemeAsync(**fast_clients)
+        # The owned client is created on entry, inside the running loop
+        MockClient.assert_not_called()
+
+        async with svc:
+            assert svc._client is MockClient.return_value
 
         # Verify aclose was called since we didn't provide a client
         mock_http_client.aclose.assert_awaited_once()
+        assert svc._client is None
 
 
-@pytest.mark.asyncio
-async def test_episteme_async_external_client(mock_clients: Dict[str, Any]) -> None:
-    external_client = AsyncMock()
-    async with EpistemeAsync(**mock_clients, client=external_client) as svc:
+async def test_episteme_async_external_client(fast_clients: Dict[str, Any]) -> None:
+    external_client = httpx.AsyncClient(transport=httpx.MockTransport(_offline_handler))
+    async with EpistemeAsync(**fast_clients, client=external_client) as svc:
         assert svc is not None
 
-    # Verify aclose was NOT called on external client
-    external_client.aclose.assert_not_awaited()
+    # Verify the external client was NOT closed
+    assert not external_client.is_closed
+    await external_client.aclose()
 
 
-def test_episteme_sync_context_manager(mock_clients: Dict[str, Any]) -> None:
+def test_episteme_sync_context_manager(fast_clients: Dict[str, Any]) -> None:
     with patch("httpx.AsyncClient") as MockClient:
-        mock_http_client = AsyncMock()
+        mock_http_client = _FakeAsyncClient()
         MockClient.return_value = mock_http_client
 
-        with Episteme(**mock_clients) as svc:
+        with Episteme(**fast_clients) as svc:
             assert svc is not None
 
-        # Episteme.__exit__ runs async __aexit__ which calls aclose
-        mock_http_client.aclose.assert_awaited_once()
+        # Each sync call runs in its own event loop, so the facade never creates a
+        # loop-bound HTTP client and there is nothing left open after __exit__
+        MockClient.assert_not_called()
+        mock_http_client.aclose.assert_not_awaited()
+
+
+def test_generate_hypothesis_sync_facade(fast_clients: Dict[str, Any]) -> None:
+    calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    class _RecordingEpisteme:
+        """Stands in for the Episteme facade, recording every run() call."""
+
+        def __init__(self, **clients: Any) -> None:
+            pass
+
+        def __enter__(self) -> "_RecordingEpisteme":
+            return self
 
+        def __exit__(self, *args: Any) -> None:
+            pass
 
-def test_generate_hypothesis_sync_facade(mock_clients: Dict[str, Any]) -> None:
-    with patch("coreason_episteme.main.Episteme") as MockEpisteme:
-        mock_instance = MagicMock()
-        MockEpisteme.return_value.__enter__.return_value = mock_instance
+        def run(self, *args: Any, **kwargs: Any) -> List[Any]:
+            calls.append((args, kwargs))
+            return []
 
-        generate_hypothesis("disease_123", **mock_clients)
+    with patch("coreason_episteme.main.Episteme", _RecordingEpisteme):
+        generate_hypothesis("disease_123", **fast_clients)
 
-        # Verify run was called with a context
-        args, kwargs = mock_instance.run.call_args
-        assert args == ("disease_123",)
-        assert "context" in kwargs
-        assert kwargs["context"].user_id == "cli-user"
+    # Verify run was called once with a context
+    assert len(calls) == 1
+    args, kwargs = calls[0]
+    assert args == ("disease_123",)
+    assert "context" in kwargs
+    assert kwargs["context"].user_id == "cli-user"
 
 
 def test_generate_hypothesis_missing_deps() -> None:
@@ -8,7 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pytest
 
@@ -72,66 +72,30 @@ class StubVeritasClient:
 # --- Tests ---
 
 
-def test_generate_hypothesis_missing_graph_client() -> None:
-    """Test that runtime error is raised if GraphNexusClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: GraphNexusClient"):
-        generate_hypothesis("TargetX", graph_client=None)
-
-
-def test_generate_hypothesis_missing_codex_client() -> None:
-    """Test that runtime error is raised if CodexClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: CodexClient"):
-        generate_hypothesis("TargetX", graph_client=StubGraphNexusClient(), codex_client=None)
-
-
-def test_generate_hypothesis_missing_search_client() -> None:
-    """Test that runtime error is raised if SearchClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: SearchClient"):
-        generate_hypothesis(
-            "TargetX",
-            graph_client=StubGraphNexusClient(),
-            codex_client=StubCodexClient(),
-            search_client=None,
-        )
-
-
-def test_generate_hypothesis_missing_prism_client() -> None:
-    """Test that runtime error is raised if PrismClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: PrismClient"):
-        generate_hypothesis(
-            "TargetX",
-            graph_client=StubGraphNexusClient(),
-            codex_client=StubCodexClient(),
-            search_client=StubSearchClient(),
-            prism_client=None,
-        )
-
-
-def test_generate_hypothesis_missing_inference_client() -> None:
-    """Test that runtime error is raised if InferenceClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: InferenceClient"):
-        generate_hypothesis(
-            "TargetX",
-            graph_client=StubGraphNexusClient(),
-            codex_client=StubCodexClient(),
-            search_client=StubSearchClient(),
-            prism_client=StubPrismClient(),
-            inference_client=None,
-        )
-
-
-def test_generate_hypothesis_missing_veritas_client() -> None:
-    """Test that runtime error is raised if VeritasClient is missing."""
-    with pytest.raises(RuntimeError, match="Missing required external client: VeritasClient"):
-        generate_hypothesis(
-            "TargetX",
-            graph_client=StubGraphNexusClient(),
-            codex_client=StubCodexClient(),
-            search_client=StubSearchClient(),
-            prism_client=StubPrismClient(),
-            inference_client=StubInferenceClient(),
-            veritas_client=None,
-        )
+# Clients in the order generate_hypothesis checks them: (keyword, interface name, stub factory).
+_STUB_CLIENTS: List[Tuple[str, str, Callable[[], Any]]] = [
+    ("graph_client", "GraphNexusClient", StubGraphNexusClient),
+    ("codex_client", "CodexClient", StubCodexClient),
+    ("search_client", "SearchClient", StubSearchClient),
+    ("prism_client", "PrismClient", StubPrismClient),
+    ("inference_client", "InferenceClient", StubInferenceClient),
+    ("veritas_client", "VeritasClient", StubVeritasClient),
+]
+
+
+@pytest.mark.parametrize(
+    "missing_index",
+    range(len(_STUB_CLIENTS)),
+    ids=[name for _, name, _ in _STUB_CLIENTS],
+)
+def test_generate_hypothesis_missing_client(missing_index: int) -> None:
+    """Test that runtime error is raised for the first missing external client."""
+    kwargs: Dict[str, Any] = {keyword: factory() for keyword, _, factory in _STUB_CLIENTS[:missing_index]}
+    missing_keyword, missing_name, _ = _STUB_CLIENTS[missing_index]
+    kwargs[missing_keyword] = None
+
+    with pytest.raises(RuntimeError, match=f"Missing required external client: {missing_name}"):
+        generate_hypothesis("TargetX", **kwargs)
 
 
 def test_generate_hypothesis_success() -> None:
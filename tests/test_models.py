@@ -8,10 +8,9 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
-import json
-
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
 
 from coreason_episteme.models import (
     PICO,
@@ -21,6 +20,23 @@ from coreason_episteme.models import (
     KnowledgeGap,
     KnowledgeGapType,
 )
+from tests.factories import make_hypothesis
+
+# Model tests share one xdist worker (see --dist=loadgroup) so Pydantic schemas are built once.
+pytestmark = pytest.mark.xdist_group("episteme_models")
+
+_PICO_ADAPTER = TypeAdapter(PICO)
+
+# Missing comparator
+_BAD_PICO = {"population": "Patients", "intervention": "Drug", "outcome": "Health"}
+
+# Shared target for the Hypothesis constructor tests (neither test mutates it).
+_GENE_X = GeneticTarget(
+    symbol="GENE-X",
+    ensembl_id="ENSG000001",
+    druggability_score=0.85,
+    novelty_score=0.9,
+)
 
 
 def test_pico_model_valid() -> None:
@@ -38,12 +54,7 @@ def test_pico_model_valid() -> None:
 def test_pico_model_invalid_missing_field() -> None:
     """Test PICO validation failure on missing field."""
     with pytest.raises(ValidationError):
-        PICO(
-            population="Patients",
-            intervention="Drug",
-            # Missing comparator
-            outcome="Health",  # type: ignore[call-arg]
-        )
+        _PICO_ADAPTER.validate_python(_BAD_PICO)
 
 
 def test_pico_equality() -> None:
@@ -120,12 +131,6 @@ def test_knowledge_gap_edge_cases() -> None:
 
 def test_hypothesis_model_valid() -> None:
     """Test creating a valid Hypothesis object with nested PICO."""
-    target = GeneticTarget(
-        symbol="GENE-X",
-        ensembl_id="ENSG000001",
-        druggability_score=0.85,
-        novelty_score=0.9,
-    )
     pico = PICO(
         population="Pop",
         intervention="Int",
@@ -137,7 +142,7 @@ def test_hypothesis_model_valid() -> None:
         title="Test Hypothesis",
         knowledge_gap="Gap Description",
         proposed_mechanism="Pathway Y",
-        target_candidate=target,
+        target_candidate=_GENE_X,
         causal_validation_score=0.75,
         key_counterfactual="If not X, then Y",
         killer_experiment_pico=pico,
@@ -151,12 +156,6 @@ def test_hypothesis_model_valid() -> None:
 
 def test_hypothesis_model_invalid_nested_pico() -> None:
     """Test Hypothesis validation when PICO is invalid (e.g. dict instead of object)."""
-    target = GeneticTarget(
-        symbol="GENE-X",
-        ensembl_id="ENSG000001",
-        druggability_score=0.85,
-        novelty_score=0.9,
-    )
 
     # Passing a dict should actually work if Pydantic can coerce it,
     # but let's test a structurally invalid dict (missing field)
@@ -166,7 +165,7 @@ def test_hypothesis_model_invalid_nested_pico() -> None:
             title="Test Hypothesis",
             knowledge_gap="Gap",
             proposed_mechanism="Mech",
-            target_candidate=target,
+            target_candidate=_GENE_X,
             causal_validation_score=0.5,
             key_counterfactual="Counter",
             killer_experiment_pico={
@@ -181,27 +180,20 @@ def test_hypothesis_model_invalid_nested_pico() -> None:
 
 def test_hypothesis_serialization() -> None:
     """Test complex object serialization and deserialization."""
-    target = GeneticTarget(
-        symbol="TargetZ",
-        ensembl_id="ENSG00000Z",
-        druggability_score=0.1,
-        novelty_score=0.2,
-    )
-    pico = PICO(
-        population="PopZ",
-        intervention="IntZ",
-        comparator="CompZ",
-        outcome="OutZ",
-    )
-    original_hyp = Hypothesis(
+    original_hyp = make_hypothesis(
         id="HYP-JSON",
-        title="JSON Test",
-        knowledge_gap="Gap JSON",
-        proposed_mechanism="Mech JSON",
-        target_candidate=target,
-        causal_validation_score=0.99,
-        key_counterfactual="Counter Z",
-        killer_experiment_pico=pico,
+        target_candidate=GeneticTarget(
+            symbol="TargetZ",
+            ensembl_id="ENSG00000Z",
+            druggability_score=0.1,
+            novelty_score=0.2,
+        ),
+        killer_experiment_pico=PICO(
+            population="PopZ",
+            intervention="IntZ",
+            comparator="CompZ",
+            outcome="OutZ",
+        ),
         evidence_chain=["E1", "E2"],
         confidence=ConfidenceLevel.PROBABLE,
     )
@@ -212,11 +204,12 @@ def test_hypothesis_serialization() -> None:
     # Deserialize back
     loaded_hyp = Hypothesis.model_validate_json(json_str)
 
-    assert loaded_hyp == original_hyp
+    # Compare the serialized forms rather than walking nested models with __eq__
+    assert loaded_hyp.model_dump_json() == json_str
     assert loaded_hyp.killer_experiment_pico.population == "PopZ"
     assert loaded_hyp.target_candidate.symbol == "TargetZ"
 
     # Verify JSON structure
-    data = json.loads(json_str)
+    data = from_json(json_str)
     assert data["killer_experiment_pico"]["population"] == "PopZ"
     assert data["confidence"] == "PROBABLE"
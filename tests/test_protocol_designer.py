@@ -13,21 +13,24 @@ import pytest
 from coreason_episteme.components.protocol_designer import ProtocolDesignerImpl
 from coreason_episteme.models import PICO, ConfidenceLevel, GeneticTarget, Hypothesis
 
+pytestmark = pytest.mark.xdist_group("episteme_models")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def protocol_designer() -> ProtocolDesignerImpl:
     return ProtocolDesignerImpl()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_hypothesis() -> Hypothesis:
-    target = GeneticTarget(
+    # Trusted literal data: skip validation of the nested models
+    target = GeneticTarget.model_construct(
         symbol="TargetX",
         ensembl_id="ENSG00000X",
         druggability_score=0.9,
         novelty_score=0.8,
     )
-    return Hypothesis(
+    return Hypothesis.model_construct(
         id="test-hyp-1",
         title="Test Hypothesis",
         knowledge_gap="Gap description",
@@ -35,18 +38,18 @@ def sample_hypothesis() -> Hypothesis:
         target_candidate=target,
         causal_validation_score=0.8,
         key_counterfactual="Counterfactual Z",
-        killer_experiment_pico=PICO(population="", intervention="", comparator="", outcome=""),
+        killer_experiment_pico=PICO.model_construct(population="", intervention="", comparator="", outcome=""),
         evidence_chain=[],
         confidence=ConfidenceLevel.PLAUSIBLE,
     )
 
 
-@pytest.mark.asyncio
 async def test_design_experiment_populates_pico(
     protocol_designer: ProtocolDesignerImpl, sample_hypothesis: Hypothesis
 ) -> None:
     """Test that the experiment design populates the PICO fields correctly."""
-    result = await protocol_designer.design_experiment(sample_hypothesis)
+    # design_experiment mutates its input, so work on a copy of the shared fixture
+    result = await protocol_designer.design_experiment(sample_hypothesis.model_copy(deep=True))
 
     assert result.killer_experiment_pico is not None
     pico = result.killer_experiment_pico
@@ -63,10 +66,10 @@ async def test_design_experiment_populates_pico(
     assert "Mechanism Y" in pico.outcome
 
 
-@pytest.mark.asyncio
 async def test_design_experiment_returns_hypothesis(
     protocol_designer: ProtocolDesignerImpl, sample_hypothesis: Hypothesis
 ) -> None:
     """Test that the method returns the modified hypothesis object."""
-    result = await protocol_designer.design_experiment(sample_hypothesis)
-    assert result is sample_hypothesis
+    hypothesis = sample_hypothesis.model_copy(deep=True)
+    result = await protocol_designer.design_experiment(hypothesis)
+    assert result is hypothesis
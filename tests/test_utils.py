@@ -8,11 +8,15 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_episteme
 
-import importlib
+import asyncio
 from pathlib import Path
+from typing import List
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from coreason_episteme.utils import logger as logger_module
+from coreason_episteme.utils.concurrency import map_bounded
 from coreason_episteme.utils.logger import logger
 
 
@@ -35,25 +39,57 @@ def test_logger_initialization() -> None:
 
 def test_logger_creates_directory_if_not_exists() -> None:
     """Test that the logger creates the log directory if it doesn't exist."""
-    # We patch pathlib.Path because the module imports it directly
-    with patch("pathlib.Path") as mock_path:
-        # Mock the Path object instance
+    with patch("coreason_episteme.utils.logger.Path") as mock_path:
         mock_path_instance = MagicMock()
         mock_path.return_value = mock_path_instance
 
-        # Simulate directory does not exist
-        mock_path_instance.exists.return_value = False
-
-        # Reload the module to trigger the top-level code
-        importlib.reload(logger_module)
+        result = logger_module._ensure_log_dir()
 
-        # Verify mkdir was called
-        mock_path_instance.mkdir.assert_called_with(parents=True, exist_ok=True)
-
-    # Restore original module to avoid side effects
-    importlib.reload(logger_module)
+        mock_path.assert_called_once_with("logs")
+        mock_path_instance.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        assert result is mock_path_instance
 
 
 def test_logger_exports() -> None:
     """Test that logger is exported."""
     assert logger is not None
+
+
+async def test_map_bounded_preserves_order() -> None:
+    """Test that results come back in input order even when later items finish first."""
+
+    async def _delayed(n: int) -> int:
+        await asyncio.sleep(0.001 * (5 - n))
+        return n * 10
+
+    assert await map_bounded(_delayed, range(5), limit=2) == [0, 10, 20, 30, 40]
+    assert await map_bounded(_delayed, [], limit=1) == []
+
+
+async def test_map_bounded_rejects_non_positive_limit() -> None:
+    """Test that a limit below 1 is rejected instead of deadlocking."""
+
+    async def _identity(n: int) -> int:
+        return n  # pragma: no cover
+
+    with pytest.raises(ValueError, match="limit must be at least 1"):
+        await map_bounded(_identity, [1], limit=0)
+
+
+async def test_map_bounded_cancels_pending_work_on_failure() -> None:
+    """Test that the first failure is re-raised with its cause and cancels the remaining calls."""
+    finished: List[int] = []
+
+    async def _work(n: int) -> int:
+        if n == 0:
+            raise RuntimeError("boom") from OSError("connection reset")
+        await asyncio.sleep(0.01)
+        finished.append(n)
+        return n
+
+    with pytest.raises(RuntimeError, match="boom") as excinfo:
+        await map_bounded(_work, range(4), limit=4)
+
+    assert isinstance(excinfo.value.__cause__, OSError)
+    await asyncio.sleep(0.02)
+    assert finished == []